@@ -1,10 +1,30 @@
+from functools import lru_cache
+
+# Placeholder logic; replace with real AI model call.
+# Templates are built once at import so each request only does a dict
+# lookup and one format() instead of an if/elif chain of f-strings.
+_TEMPLATES = {
+    'data': "[{tone}] [{age}] Data Usage: We collect your data, but promise to be nice!",
+    'rights': "[{tone}] [{age}] User Rights: Play nice, or we take your toys away.",
+    'cancellation': "[{tone}] [{age}] Cancellation: Cancel anytime, refunds if you ask politely!",
+}
+
+
+@lru_cache(maxsize=64)
+def _title(s):
+    return s.title()
+
+
+@lru_cache(maxsize=256)
+def _render(category, tone, age_group):
+    template = _TEMPLATES.get(category)
+    if template is None:
+        return "Unknown category."
+    return template.format(tone=_title(tone), age=_title(age_group))
+
+
 def summarize_tc(tc_text, category, tone, age_group):
-    # Placeholder logic; replace with real AI model call
-    if category == 'data':
-        return f"[{tone.title()}] [{age_group.title()}] Data Usage: We collect your data, but promise to be nice!"
-    elif category == 'rights':
-        return f"[{tone.title()}] [{age_group.title()}] User Rights: Play nice, or we take your toys away."
-    elif category == 'cancellation':
-        return f"[{tone.title()}] [{age_group.title()}] Cancellation: Cancel anytime, refunds if you ask politely!"
-    else:
-        return "Unknown category." 
\ No newline at end of file
+    # The (category, tone, age_group) input space is tiny, so rendered
+    # summaries are memoized. tc_text will matter once a real model is
+    # plugged in; drop the cache indirection then.
+    return _render(category, tone, age_group)
@@ -1,19 +1,33 @@
 from fastapi import FastAPI, UploadFile, File, Form
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import Optional
 from .ai_utils import summarize_tc
 
-app = FastAPI()
+# orjson encodes responses several times faster than the stdlib json encoder
+app = FastAPI(default_response_class=ORJSONResponse)
 
+# Explicit origins instead of "*": the frontend is a local static page, and
+# a concrete list lets browsers cache preflight answers per origin
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=[
+        "http://localhost:8000",
+        "http://127.0.0.1:8000",
+        "http://localhost:5500",
+        "http://127.0.0.1:5500",
+        "null",  # frontend opened directly from file://
+    ],
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
+# Pasted T&C texts are large and highly compressible
+app.add_middleware(GZipMiddleware, minimum_size=512)
+
 class SummaryRequest(BaseModel):
     tc_text: str
     category: str  # 'data', 'rights', 'cancellation'
@@ -21,6 +35,7 @@ class SummaryRequest(BaseModel):
     age_group: Optional[str] = 'adult'
 
 @app.post("/summarize/")
-def summarize(request: SummaryRequest):
+async def summarize(request: SummaryRequest):
+    # async def: nothing in the body blocks, so skip the threadpool hop
     summary = summarize_tc(request.tc_text, request.category, request.tone, request.age_group)
-    return {"summary": summary} 
\ No newline at end of file
+    return {"summary": summary}
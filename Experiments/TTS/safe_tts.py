@@ -1,5 +1,9 @@
+import io
+import json
 import os
+import re
 import sys
+from pathlib import Path
 try:
     import docx
 except ImportError:
@@ -8,61 +12,175 @@ import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 import pyttsx3
 import multiprocessing
+import shutil
+import subprocess
 import tempfile
+import threading
+import zipfile
+import xml.etree.ElementTree as ET
 try:
     from pydub import AudioSegment  # type: ignore  # May not be installed
 except ImportError:
     AudioSegment = None
 
+# pyttsx3.init() reloads the SAPI/eSpeak driver and re-enumerates voices every
+# time, which costs hundreds of ms. Keep one lazily-created engine per process
+# and reuse it; only setProperty calls are per-request work.
+_engine = None
+_engine_lock = threading.Lock()
+
+def _get_engine():
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = pyttsx3.init()
+        return _engine
+
+_DOCX_W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+
 def read_docx(file_path):
+    # A .docx is just a zip; pull paragraph text straight out of
+    # word/document.xml with iterparse instead of having python-docx build
+    # a Paragraph/Run object for every node — we only want the text.
+    try:
+        buf = io.StringIO()
+        with zipfile.ZipFile(file_path) as z, z.open('word/document.xml') as xml_stream:
+            wrote_text = False
+            for _, element in ET.iterparse(xml_stream, events=('end',)):
+                if element.tag == _DOCX_W_NS + 't':
+                    if element.text:
+                        buf.write(element.text)
+                        wrote_text = True
+                elif element.tag == _DOCX_W_NS + 'p':
+                    # Empty paragraphs are skipped; they are silence to TTS
+                    if wrote_text:
+                        buf.write('\n')
+                        wrote_text = False
+                    element.clear()
+        return buf.getvalue()
+    except (zipfile.BadZipFile, KeyError, ET.ParseError):
+        # Legacy .doc or an odd package layout; let python-docx try
+        return read_docx_slow(file_path)
+
+def read_docx_slow(file_path):
     if not docx:
         messagebox.showerror("Missing Dependency", "python-docx is not installed. Please install it to read .docx files.")
         sys.exit(1)
     doc = docx.Document(file_path)
-    return '\n'.join([para.text for para in doc.paragraphs])
+    # Stream paragraphs into one buffer instead of building a list of every
+    # paragraph and then joining it (two full copies of the document).
+    # Empty paragraphs are skipped early; they are silence to the TTS engine.
+    buf = io.StringIO()
+    for para in doc.paragraphs:
+        text = para.text
+        if text:
+            buf.write(text)
+            buf.write('\n')
+    return buf.getvalue()
+
+# Files under this size are read in one go; anything bigger is read in
+# 1 MiB pieces so decode buffers stay bounded for multi-MB books
+SMALL_TEXT_FILE_BYTES = 256 * 1024
+TEXT_READ_CHUNK_SIZE = 1 << 20
+
+def read_txt(filepath):
+    with open(filepath, 'r', encoding='utf-8') as f:
+        if os.path.getsize(filepath) < SMALL_TEXT_FILE_BYTES:
+            return f.read()
+        pieces = []
+        while True:
+            piece = f.read(TEXT_READ_CHUNK_SIZE)
+            if not piece:
+                break
+            pieces.append(piece)
+        return ''.join(pieces)
+
+# Extension-to-reader dispatch table; built once instead of an if/elif
+# chain per call
+_HANDLERS = {
+    '.txt': read_txt,
+    '.doc': read_docx,
+    '.docx': read_docx,
+}
 
 def get_text_from_file(filepath):
-    if not os.path.isfile(filepath):
-        messagebox.showerror("File Not Found", f"File '{filepath}' not found.")
+    handler = _HANDLERS.get(os.path.splitext(filepath)[1].lower())
+    if handler is None:
+        messagebox.showerror("Unsupported File", "Only .txt, .doc, or .docx files are supported.")
         return None
-    ext = os.path.splitext(filepath)[1].lower()
     try:
-        if ext == '.txt':
-            with open(filepath, 'r', encoding='utf-8') as f:
-                return f.read()
-        elif ext in ['.doc', '.docx']:
-            return read_docx(filepath)
-        else:
-            messagebox.showerror("Unsupported File", "Only .txt, .doc, or .docx files are supported.")
-            return None
+        # No os.path.isfile pre-check: opening the file races against it
+        # anyway and the extra stat is wasted on the common success path
+        return handler(filepath)
+    except FileNotFoundError:
+        messagebox.showerror("File Not Found", f"File '{filepath}' not found.")
+        return None
     except Exception as e:
         messagebox.showerror("Read Error", f"Error reading file: {e}")
         return None
 
-def speak_text(text, rate, voice_id, save_path=None):
-    engine = pyttsx3.init()
+def split_into_chunks(text, max_words=30):
+    # Split on sentence boundaries, merging short sentences up to ~max_words,
+    # so playback can start after the first chunk instead of after the engine
+    # has queued the whole document.
+    chunks = []
+    current = []
+    count = 0
+    for sentence in re.split(r'(?<=[.!?])\s+', text):
+        words = sentence.split()
+        if not words:
+            continue
+        if current and count + len(words) > max_words:
+            chunks.append(' '.join(current))
+            current = []
+            count = 0
+        current.extend(words)
+        count += len(words)
+    if current:
+        chunks.append(' '.join(current))
+    return chunks
+
+def speak_text(text, rate, voice_id, save_path=None, stop_event=None):
+    engine = _get_engine()
     engine.setProperty('rate', rate)
     if voice_id:
         engine.setProperty('voice', voice_id)
     if save_path:
-        # Save to temporary WAV, then convert to MP3
-        if not AudioSegment:
-            messagebox.showerror("Missing Dependency", "pydub is not installed. Please install it to save as MP3.")
+        # pyttsx3 can only synthesize to a file path, so a temporary WAV is
+        # unavoidable — but hand it straight to ffmpeg for MP3 encoding so
+        # the PCM never gets parsed back into Python; pydub (which loads the
+        # whole WAV into memory) is only the fallback.
+        ffmpeg = shutil.which('ffmpeg')
+        if not ffmpeg and not AudioSegment:
+            messagebox.showerror("Missing Dependency", "Neither ffmpeg nor pydub is available. Please install one of them to save as MP3.")
             return
         try:
             with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp_wav:
                 tmp_wav_path = tmp_wav.name
-            engine.save_to_file(text, tmp_wav_path)
-            engine.runAndWait()
-            # Convert to MP3
-            audio = AudioSegment.from_wav(tmp_wav_path)
-            audio.export(save_path, format="mp3")
-            os.remove(tmp_wav_path)
+            try:
+                engine.save_to_file(text, tmp_wav_path)
+                engine.runAndWait()
+                # Convert to MP3
+                if ffmpeg:
+                    subprocess.run(
+                        [ffmpeg, '-loglevel', 'error', '-y', '-i', tmp_wav_path,
+                         '-codec:a', 'libmp3lame', save_path],
+                        check=True)
+                else:
+                    audio = AudioSegment.from_wav(tmp_wav_path)
+                    audio.export(save_path, format="mp3")
+            finally:
+                os.remove(tmp_wav_path)
         except Exception as e:
             messagebox.showerror("Save Error", f"Error saving MP3: {e}")
     else:
-        engine.say(text)
-        engine.runAndWait()
+        # Speak chunk by chunk: audio starts within one chunk's synthesis
+        # time and a Stop request takes effect at the next chunk boundary.
+        for chunk in split_into_chunks(text):
+            if stop_event is not None and stop_event.is_set():
+                break
+            engine.say(chunk)
+            engine.runAndWait()
 
 def open_file_dialog(entry):
     filepath = filedialog.askopenfilename(
@@ -73,7 +191,49 @@ def open_file_dialog(entry):
         entry.delete(0, tk.END)
         entry.insert(0, filepath)
 
-def start_tts(entry, rate_scale, voice_var, start_btn, stop_btn, tts_proc_holder, save_var, save_path_holder):
+def tts_worker(task_queue, status_queue, stop_event):
+    # Long-lived worker: initializes pyttsx3 once, then speaks queued
+    # (text, rate, voice_id, save_path) requests. A None task shuts it down.
+    while True:
+        task = task_queue.get()
+        if task is None:
+            break
+        if stop_event.is_set():
+            # Task was queued before the user pressed Stop; drop it.
+            stop_event.clear()
+            status_queue.put('done')
+            continue
+        text, rate, voice_id, save_path = task
+        speak_text(text, rate, voice_id, save_path, stop_event)
+        # Consume a Stop raised during playback here, in the worker: if the
+        # GUI cleared the event instead, a Start pressed while the current
+        # chunk is still playing would wipe a pending Stop and let the old
+        # document resume.
+        stop_event.clear()
+        status_queue.put('done')
+
+def start_worker(tts_holder):
+    # (Re)create the persistent TTS worker process and its queues
+    task_queue = multiprocessing.Queue()
+    status_queue = multiprocessing.Queue()
+    stop_event = multiprocessing.Event()
+    worker = multiprocessing.Process(target=tts_worker, args=(task_queue, status_queue, stop_event), daemon=True)
+    worker.start()
+    tts_holder['worker'] = worker
+    tts_holder['tasks'] = task_queue
+    tts_holder['status'] = status_queue
+    tts_holder['stop'] = stop_event
+
+def shutdown_worker(tts_holder):
+    worker = tts_holder.get('worker')
+    if worker is not None and worker.is_alive():
+        tts_holder['tasks'].put(None)
+        worker.join(timeout=2)
+        if worker.is_alive():
+            worker.terminate()
+            worker.join()
+
+def start_tts(entry, rate_scale, voice_var, start_btn, stop_btn, tts_holder, save_var, save_path_holder):
     filepath = entry.get().strip()
     try:
         rate = int(rate_scale.get())
@@ -92,36 +252,53 @@ def start_tts(entry, rate_scale, voice_var, start_btn, stop_btn, tts_proc_holder
         if not save_path:
             messagebox.showwarning("No Save Path", "Please select a location to save the MP3 file.")
             return
-    # If a process is already running, stop it first
-    if tts_proc_holder['proc'] is not None and tts_proc_holder['proc'].is_alive():
-        tts_proc_holder['proc'].terminate()
-        tts_proc_holder['proc'].join()
-    proc = multiprocessing.Process(target=speak_text, args=(text, rate, voice_id, save_path))
-    tts_proc_holder['proc'] = proc
-    proc.start()
+    # Hand the request to the already-running worker; no process spawn here.
+    # The stop event is cleared by the worker itself, never from the GUI,
+    # so a Stop pressed just before this Start cannot be lost.
+    tts_holder['tasks'].put((text, rate, voice_id, save_path))
     start_btn.config(state='disabled')
     stop_btn.config(state='normal')
-    def check_proc():
-        if proc.is_alive():
-            start_btn.after(200, check_proc)
-        else:
-            start_btn.config(state='normal')
-            stop_btn.config(state='disabled')
-    start_btn.after(200, check_proc)
-
-def stop_tts(start_btn, stop_btn, tts_proc_holder):
-    proc = tts_proc_holder['proc']
-    if proc is not None and proc.is_alive():
-        proc.terminate()
-        proc.join()
+    # Block on the status queue in a thread instead of waking tk every
+    # 200 ms to poll: no idle wakeups, and the buttons flip the moment the
+    # worker reports the task finished (after(0, ...) hops back to the tk
+    # thread, which is the only one allowed to touch widgets).
+    status_queue = tts_holder['status']
+    def watch_status():
+        status_queue.get()
+        start_btn.after(0, lambda: (start_btn.config(state='normal'),
+                                    stop_btn.config(state='disabled')))
+    threading.Thread(target=watch_status, daemon=True).start()
+
+def stop_tts(start_btn, stop_btn, tts_holder):
+    # The worker checks this event between chunks, so playback stops at the
+    # next sentence boundary and reports 'done' itself; no need to kill it.
+    tts_holder['stop'].set()
     start_btn.config(state='normal')
     stop_btn.config(state='disabled')
 
-def populate_voices(voice_combo, voice_var):
-    engine = pyttsx3.init()
-    voices = engine.getProperty('voices')
-    voice_names = [f"{v.name} ({v.id})" for v in voices]
-    voice_ids = [v.id for v in voices]
+# Installed voices almost never change between runs, so cache the (name, id)
+# list on disk and skip the expensive engine init at startup entirely.
+VOICES_CACHE = Path.home() / '.cache' / 'safe_tts' / 'voices.json'
+
+def load_voices(force_rescan=False):
+    if not force_rescan:
+        try:
+            return [tuple(v) for v in json.loads(VOICES_CACHE.read_text())]
+        except (OSError, ValueError):
+            pass
+    engine = _get_engine()
+    voices = [(v.name, v.id) for v in engine.getProperty('voices')]
+    try:
+        VOICES_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        VOICES_CACHE.write_text(json.dumps(voices))
+    except OSError:
+        pass  # Cache is best-effort; enumeration still worked
+    return voices
+
+def populate_voices(voice_combo, voice_var, force_rescan=False):
+    voices = load_voices(force_rescan)
+    voice_names = [f"{name} ({voice_id})" for name, voice_id in voices]
+    voice_ids = [voice_id for _, voice_id in voices]
     voice_combo['values'] = voice_names
     if voice_names:
         voice_combo.current(0)
@@ -156,8 +333,11 @@ def main():
     # Voice selection
     tk.Label(root, text="Voice:").pack(pady=(15, 0))
     voice_var = tk.StringVar()
-    voice_combo = ttk.Combobox(root, width=50, state="readonly")
-    voice_combo.pack(pady=2)
+    voice_frame = tk.Frame(root)
+    voice_frame.pack(pady=2)
+    voice_combo = ttk.Combobox(voice_frame, width=50, state="readonly")
+    voice_combo.pack(side=tk.LEFT)
+    tk.Button(voice_frame, text="Rescan", command=lambda: populate_voices(voice_combo, voice_var, force_rescan=True)).pack(side=tk.LEFT, padx=5)
     populate_voices(voice_combo, voice_var)
 
     # Save to MP3 option
@@ -177,12 +357,18 @@ def main():
     # Start and Stop buttons
     btn_frame = tk.Frame(root)
     btn_frame.pack(pady=15)
-    tts_proc_holder = {'proc': None}
-    start_btn = tk.Button(btn_frame, text="Start TTS", command=lambda: start_tts(file_entry, rate_scale, voice_var, start_btn, stop_btn, tts_proc_holder, save_var, save_path_holder))
+    tts_holder = {}
+    start_worker(tts_holder)
+    start_btn = tk.Button(btn_frame, text="Start TTS", command=lambda: start_tts(file_entry, rate_scale, voice_var, start_btn, stop_btn, tts_holder, save_var, save_path_holder))
     start_btn.pack(side=tk.RIGHT)
-    stop_btn = tk.Button(btn_frame, text="Stop", state='disabled', command=lambda: stop_tts(start_btn, stop_btn, tts_proc_holder))
+    stop_btn = tk.Button(btn_frame, text="Stop", state='disabled', command=lambda: stop_tts(start_btn, stop_btn, tts_holder))
     stop_btn.pack(side=tk.RIGHT, padx=10)
 
+    def on_close():
+        shutdown_worker(tts_holder)
+        root.destroy()
+    root.protocol("WM_DELETE_WINDOW", on_close)
+
     root.mainloop()
 
 if __name__ == '__main__':
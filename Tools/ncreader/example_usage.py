@@ -99,12 +99,15 @@ def create_sample_netcdf():
         lons[:] = np.linspace(-180, 180, 100)
         
         # Create realistic temperature data
-        for t in range(100):
-            # Simple temperature model: varies with latitude and has some time variation
-            temp = 30 * np.cos(np.radians(lats)) + 10 * np.sin(2 * np.pi * t / 365)
-            temp = temp[:, np.newaxis] + np.random.normal(0, 2, (50, 100))
-            temperature[t, :, :] = temp
-        
+        # Simple temperature model: varies with latitude and has some time
+        # variation. Build the whole (100, 50, 100) array via broadcasting
+        # and write it in one assignment instead of 100 per-step writes.
+        t = np.arange(100)[:, np.newaxis, np.newaxis]
+        lat_rad = np.radians(np.linspace(-90, 90, 50))[np.newaxis, :, np.newaxis]
+        base = 30 * np.cos(lat_rad) + 10 * np.sin(2 * np.pi * t / 365)
+        noise = np.random.default_rng().normal(0, 2, (100, 50, 100))
+        temperature[:] = (base + noise).astype('f4')
+
         print("Sample NetCDF file 'sample_data.nc' created successfully!")
 
 if __name__ == "__main__":
@@ -17,25 +17,119 @@ pip install netCDF4 numpy matplotlib pandas
 """
 
 import os
+import re
 import sys
+import zlib
 import argparse
+from dataclasses import dataclass, field
 from pathlib import Path
 import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
+import netCDF4
 from netCDF4 import Dataset
 import warnings
 warnings.filterwarnings('ignore')
 
-# Add tkinter for file dialog
+# matplotlib, pandas and tkinter are deferred to the functions that need
+# them: together they add seconds to cold start, and metadata-only runs
+# (--info, --list-vars) never touch plotting, CSV fallback or dialogs
+
+
+def _import_tk():
+    """Import tkinter on first use; returns (tk, filedialog, simpledialog,
+    messagebox) or None when tkinter is unavailable."""
+    try:
+        import tkinter as tk
+        from tkinter import filedialog, simpledialog, messagebox
+    except ImportError:
+        return None
+    return tk, filedialog, simpledialog, messagebox
+
+# Optional: JIT-compiled statistics kernel
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Optional: low-level HDF5 access for the mmap read fast path
 try:
-    import tkinter as tk
-    from tkinter import filedialog, simpledialog, messagebox
+    import h5py
 except ImportError:
-    tk = None
-    filedialog = None
-    simpledialog = None
-    messagebox = None
+    h5py = None
+
+# Elements per block for the fallback fused-statistics pass
+_STATS_BLOCK = 1 << 20
+
+# Attributes that make netCDF4 transform data on read (scaling, masking,
+# valid-range screening); variables carrying any of these must go through
+# the normal netCDF4 path rather than the raw h5py fast paths
+_CONVERT_ATTRS = frozenset({
+    'scale_factor', 'add_offset', '_FillValue', 'missing_value',
+    'valid_range', 'valid_min', 'valid_max',
+})
+
+
+@dataclass(slots=True)
+class VarInfo:
+    """Cached metadata for one variable. slots=True keeps instances to a
+    fixed-layout struct — no per-instance __dict__ — which matters when the
+    metadata cache covers files with thousands of variables."""
+    name: str
+    dimensions: tuple
+    shape: tuple
+    dtype: object
+    attributes: dict = field(default_factory=dict)
+
+if njit is not None:
+    @njit(fastmath=True, cache=True)
+    def _partial_stats_jit(a):
+        mn = a[0]
+        mx = a[0]
+        s = 0.0
+        s2 = 0.0
+        # Explicit indexed loop (not `for v in a`) so LLVM can vectorize
+        for i in range(a.size):
+            v = a[i]
+            if v < mn:
+                mn = v
+            if v > mx:
+                mx = v
+            s += v
+            s2 += v * v
+        return a.size, mn, mx, s, s2
+
+
+def _partial_stats(a):
+    """
+    Compute (count, min, max, sum, sum-of-squares) in one pass over `a`.
+
+    Calling np.min/np.max/np.mean/np.std separately streams the whole buffer
+    from RAM four times; the reductions here share a single traversal. Uses
+    a Numba kernel when available, otherwise processes cache-sized blocks so
+    each block is reduced four ways while it is still hot.
+    """
+    a = np.ascontiguousarray(a).ravel()
+    if a.size == 0:
+        return 0, np.nan, np.nan, 0.0, 0.0
+    if njit is not None and a.dtype.kind == 'f':
+        return _partial_stats_jit(a)
+    mn = np.inf
+    mx = -np.inf
+    s = 0.0
+    s2 = 0.0
+    for start in range(0, a.size, _STATS_BLOCK):
+        block = a[start:start + _STATS_BLOCK].astype(np.float64, copy=False)
+        mn = min(mn, block.min())
+        mx = max(mx, block.max())
+        s += block.sum()
+        s2 += np.dot(block, block)
+    return a.size, mn, mx, s, s2
+
+
+def _finish_stats(n, mn, mx, s, s2):
+    """Turn the fused partials into (min, max, mean, std) floats."""
+    mean = s / n
+    variance = max(s2 / n - mean * mean, 0.0)  # clamp rounding below zero
+    return float(mn), float(mx), float(mean), float(variance ** 0.5)
 
 
 class NetCDFReader:
@@ -44,22 +138,46 @@ class NetCDFReader:
     def __init__(self, file_path):
         """
         Initialize the NetCDF reader.
-        
+
         Args:
             file_path (str): Path to the NetCDF file
         """
         self.file_path = file_path
         self.dataset = None
+        self._tuned_vars = set()
+        # netCDF4's .variables/.dimensions are properties that rebuild their
+        # dict from libnetcdf on every access; grab them once (load_file)
+        self._vars = {}
+        self._dims = {}
+        self._var_meta = {}
+        self._fig = None  # reused across plot_variable calls
+        self._file_size = 0
+        # Per-variable output buffers reused across full reads, so repeated
+        # reads of the same variable overwrite one allocation instead of
+        # malloc/faulting a fresh multi-GB array every time
+        self._read_buf = {}
         self.load_file()
     
     def load_file(self):
         """Load the NetCDF file."""
         try:
-            if not os.path.exists(self.file_path):
-                raise FileNotFoundError(f"File not found: {self.file_path}")
-            
+            # The default 1 MB HDF5 chunk cache is too small for real
+            # variables; 256 MB turns repeated slicing into memory hits
+            try:
+                netCDF4.set_chunk_cache(256 * 1024 * 1024, 8009, 0.75)
+            except Exception:
+                pass  # older netCDF4 builds without set_chunk_cache
+            # No os.path.exists pre-check: Dataset raises for a missing file
+            # anyway, and the extra stat costs real time on network
+            # filesystems. The size is grabbed once here for get_file_info.
             self.dataset = Dataset(self.file_path, 'r')
+            self._file_size = os.stat(self.file_path).st_size
+            self._vars = self.dataset.variables
+            self._dims = self.dataset.dimensions
             print(f"Successfully loaded: {self.file_path}")
+        except FileNotFoundError:
+            print(f"Error loading file: File not found: {self.file_path}")
+            sys.exit(1)
         except Exception as e:
             print(f"Error loading file: {e}")
             sys.exit(1)
@@ -71,10 +189,10 @@ class NetCDFReader:
         
         info = {
             'file_path': self.file_path,
-            'file_size': f"{os.path.getsize(self.file_path) / (1024*1024):.2f} MB",
+            'file_size': f"{self._file_size / (1024*1024):.2f} MB",
             'format': self.dataset.file_format,
-            'num_dimensions': len(self.dataset.dimensions),
-            'num_variables': len(self.dataset.variables),
+            'num_dimensions': len(self._dims),
+            'num_variables': len(self._vars),
             'num_global_attributes': len(self.dataset.ncattrs())
         }
         
@@ -86,55 +204,57 @@ class NetCDFReader:
         if not info:
             return
         
-        print("\n" + "="*60)
-        print("NETCDF FILE INFORMATION")
-        print("="*60)
-        for key, value in info.items():
-            print(f"{key.replace('_', ' ').title()}: {value}")
-        
-        # Print dimensions
-        print(f"\nDimensions ({len(self.dataset.dimensions)}):")
-        for dim_name, dim in self.dataset.dimensions.items():
-            size = len(dim) if not dim.isunlimited() else "unlimited"
-            print(f"  {dim_name}: {size}")
-        
-        # Print variables
-        print(f"\nVariables ({len(self.dataset.variables)}):")
-        for var_name, var in self.dataset.variables.items():
-            dims = ', '.join(var.dimensions)
-            shape = var.shape
-            dtype = var.dtype
-            print(f"  {var_name}: {dtype} {shape} ({dims})")
-        
-        # Print global attributes
-        if self.dataset.ncattrs():
-            print(f"\nGlobal Attributes ({len(self.dataset.ncattrs())}):")
-            for attr_name in self.dataset.ncattrs():
+        # Build everything and write once: one stdout flush instead of one
+        # per line, which matters over remote terminals on big files
+        parts = ["", "="*60, "NETCDF FILE INFORMATION", "="*60]
+        parts.extend(f"{key.replace('_', ' ').title()}: {value}" for key, value in info.items())
+
+        # Dimensions
+        parts.append(f"\nDimensions ({len(self._dims)}):")
+        parts.extend(f"  {dim_name}: {len(dim) if not dim.isunlimited() else 'unlimited'}"
+                     for dim_name, dim in self._dims.items())
+
+        # Variables
+        parts.append(f"\nVariables ({len(self._vars)}):")
+        parts.extend(f"  {var_name}: {var.dtype} {var.shape} ({', '.join(var.dimensions)})"
+                     for var_name, var in self._vars.items())
+
+        # Global attributes
+        global_attrs = self.dataset.ncattrs()
+        if global_attrs:
+            parts.append(f"\nGlobal Attributes ({len(global_attrs)}):")
+            for attr_name in global_attrs:
                 attr_value = self.dataset.getncattr(attr_name)
                 # Truncate long attribute values
                 if len(str(attr_value)) > 100:
                     attr_value = str(attr_value)[:100] + "..."
-                print(f"  {attr_name}: {attr_value}")
+                parts.append(f"  {attr_name}: {attr_value}")
+
+        sys.stdout.write('\n'.join(parts) + '\n')
     
     def get_variable_info(self, var_name):
         """Get detailed information about a specific variable."""
-        if var_name not in self.dataset.variables:
+        if var_name not in self._vars:
             print(f"Variable '{var_name}' not found in the dataset.")
             return None
-        
-        var = self.dataset.variables[var_name]
-        info = {
-            'name': var_name,
-            'dimensions': var.dimensions,
-            'shape': var.shape,
-            'dtype': var.dtype,
-            'attributes': {}
-        }
-        
-        # Get variable attributes
-        for attr_name in var.ncattrs():
-            info['attributes'][attr_name] = var.getncattr(attr_name)
-        
+
+        # Metadata is immutable for a read-only dataset, so the ncattrs()
+        # FFI round-trips only happen on the first call per variable
+        info = self._var_meta.get(var_name)
+        if info is not None:
+            return info
+
+        var = self._vars[var_name]
+        info = VarInfo(
+            name=var_name,
+            dimensions=var.dimensions,
+            shape=var.shape,
+            dtype=var.dtype,
+            attributes={attr_name: var.getncattr(attr_name)
+                        for attr_name in var.ncattrs()},
+        )
+
+        self._var_meta[var_name] = info
         return info
     
     def print_variable_info(self, var_name):
@@ -143,47 +263,334 @@ class NetCDFReader:
         if not info:
             return
         
-        print(f"\nVariable: {info['name']}")
-        print(f"Dimensions: {info['dimensions']}")
-        print(f"Shape: {info['shape']}")
-        print(f"Data Type: {info['dtype']}")
-        
-        if info['attributes']:
-            print("Attributes:")
-            for attr_name, attr_value in info['attributes'].items():
-                print(f"  {attr_name}: {attr_value}")
+        parts = [
+            f"\nVariable: {info.name}",
+            f"Dimensions: {info.dimensions}",
+            f"Shape: {info.shape}",
+            f"Data Type: {info.dtype}",
+        ]
+
+        if info.attributes:
+            parts.append("Attributes:")
+            parts.extend(f"  {attr_name}: {attr_value}"
+                         for attr_name, attr_value in info.attributes.items())
+
+        sys.stdout.write('\n'.join(parts) + '\n')
     
+    def _tune_chunk_cache(self, var_name):
+        """
+        Size the per-variable HDF5 chunk cache so it holds several chunks.
+
+        Done once per variable, on first read; a cache that cannot fit even
+        one chunk makes every repeated slice re-decompress from disk.
+        """
+        if var_name in self._tuned_vars:
+            return
+        self._tuned_vars.add(var_name)
+        var = self._vars[var_name]
+        try:
+            chunks = var.chunking()
+            if not chunks or chunks == 'contiguous':
+                return
+            chunk_bytes = int(np.prod(chunks)) * var.dtype.itemsize
+            var.set_var_chunk_cache(max(chunk_bytes * 8, 16 * 1024 * 1024), 4001, 0.75)
+        except Exception:
+            pass  # cache sizing is best-effort; reads still work without it
+
+    def _mask_default_fill(self, var, data):
+        """
+        Mask library-default fill values after a raw h5py read.
+
+        netCDF4's auto-masking hides the default netCDF fill value even when
+        no _FillValue attribute is set, so a partially written variable read
+        through the fast paths would otherwise leak ~9.97e36 fills into
+        stats, plots and exports. Replicates that masking here.
+        """
+        fill = netCDF4.default_fillvals.get(f'{data.dtype.kind}{data.dtype.itemsize}')
+        if fill is None:
+            return data
+        mask = data == fill
+        if mask.any():
+            return np.ma.masked_array(data, mask=mask)
+        return data
+
+    def _mmap_contiguous(self, var_name, var):
+        """
+        Zero-copy read of a contiguous, unfiltered variable via np.memmap.
+
+        A contiguous HDF5 dataset is just a byte range at a known offset, so
+        mapping it lets the OS page cache serve the data with no extra copy
+        through libhdf5. Returns None when the fast path does not apply.
+        """
+        if h5py is None:
+            return None
+        if var.chunking() != 'contiguous' or any(var.filters().values()):
+            return None
+        # Scaled or masked variables need netCDF4's automatic conversion
+        if _CONVERT_ATTRS & set(var.ncattrs()):
+            return None
+        with h5py.File(self.file_path, 'r') as h5f:
+            dset = h5f[var_name]
+            offset = dset.id.get_offset()
+            dtype = dset.dtype  # on-disk byte order, unlike var.dtype
+        if offset is None:
+            return None
+        data = np.memmap(self.file_path, dtype=dtype, mode='r',
+                         offset=offset, shape=var.shape)
+        native = dtype.newbyteorder('=')
+        if dtype != native:
+            # Big-endian storage (endian='big' or a big-endian producer):
+            # mapping the raw bytes as native would return swapped garbage,
+            # so pay for one sequential byteswapping copy instead
+            return data.astype(native)
+        return data
+
+    def _get_read_buffer(self, var_name, shape, dtype):
+        """Return the reusable output buffer for a variable, (re)allocating
+        only when the shape or dtype changed. Callers get the same array on
+        every full read, so consume it before reading the variable again."""
+        buf = self._read_buf.get(var_name)
+        if buf is None or buf.shape != shape or buf.dtype != dtype:
+            buf = np.empty(shape, dtype=dtype)
+            self._read_buf[var_name] = buf
+        return buf
+
+    def _read_into_buffer(self, var_name, var):
+        """
+        Full read into the reusable per-variable buffer via h5py.
+
+        read_direct writes into a caller-provided array with no intermediate
+        allocation; netCDF4's var[:] always mallocs a fresh one. Returns
+        None when the fast path does not apply.
+        """
+        if h5py is None:
+            return None
+        # Scaled or masked variables need netCDF4's automatic conversion
+        if _CONVERT_ATTRS & set(var.ncattrs()):
+            return None
+        buf = self._get_read_buffer(var_name, var.shape, np.dtype(var.dtype))
+        with h5py.File(self.file_path, 'r') as h5f:
+            h5f[var_name].read_direct(buf)
+        return buf
+
+    def _read_direct_chunks(self, var_name, var):
+        """
+        Assemble a deflate-compressed variable from raw chunk reads.
+
+        read_direct_chunk fetches each compressed chunk with one pread,
+        bypassing HDF5's filter pipeline and sieve buffer (which issue many
+        small reads per chunk); deflate and the shuffle filter are undone
+        here with zlib and a NumPy byte transpose. Returns None whenever
+        the storage layout is anything other than plain deflate(+shuffle).
+        """
+        if h5py is None:
+            return None
+        filters = var.filters()
+        if not filters.get('zlib'):
+            return None
+        # Anything beyond deflate+shuffle (fletcher32, szip, blosc, ...)
+        # keeps the normal read path
+        if any(value for name, value in filters.items()
+               if name not in ('zlib', 'shuffle', 'complevel')):
+            return None
+        # Scaled or masked variables need netCDF4's automatic conversion
+        if _CONVERT_ATTRS & set(var.ncattrs()):
+            return None
+        chunks = var.chunking()
+        if not chunks or chunks == 'contiguous':
+            return None
+
+        unshuffle = bool(filters.get('shuffle'))
+        chunk_elems = int(np.prod(chunks))
+        with h5py.File(self.file_path, 'r') as h5f:
+            dset = h5f[var_name]
+            dtype = dset.dtype  # on-disk byte order
+            out = self._get_read_buffer(var_name, var.shape, dtype)
+            dset_id = dset.id
+            # get_chunk_info(i) is O(i) inside libhdf5, so indexing every
+            # chunk is quadratic; chunk_iter walks the chunk index once
+            # where available (h5py >= 3.8)
+            if hasattr(dset_id, 'chunk_iter'):
+                chunk_infos = []
+                dset_id.chunk_iter(chunk_infos.append)
+            else:
+                chunk_infos = [dset_id.get_chunk_info(i)
+                               for i in range(dset_id.get_num_chunks())]
+            # Never-written chunks are simply absent from the file (common
+            # for variables under an unlimited dimension written for fewer
+            # records than the dimension length); the normal read path
+            # returns fill values there, so seed the buffer with the fill
+            # before assembling — otherwise those regions would be
+            # uninitialized heap memory
+            expected = int(np.prod([-(-s // c) for s, c in zip(var.shape, chunks)]))
+            if len(chunk_infos) < expected:
+                fill = dset.fillvalue
+                if fill is None:
+                    return None
+                out[...] = fill
+            for chunk_info in chunk_infos:
+                chunk_offset = chunk_info.chunk_offset
+                filter_mask, raw = dset_id.read_direct_chunk(chunk_offset)
+                # A nonzero mask means some filter was skipped when this
+                # chunk was written; decoding it as plain deflate(+shuffle)
+                # would corrupt it silently, so take the normal read path
+                if filter_mask:
+                    return None
+                buf = zlib.decompress(raw)
+                if unshuffle:
+                    # Shuffle groups byte k of every element together;
+                    # transpose the (itemsize, nelems) view to undo it
+                    shuffled = np.frombuffer(buf, dtype=np.uint8).reshape(dtype.itemsize, chunk_elems)
+                    block = np.frombuffer(np.ascontiguousarray(shuffled.T).tobytes(), dtype=dtype)
+                else:
+                    block = np.frombuffer(buf, dtype=dtype)
+                block = block.reshape(chunks)
+                # Edge chunks are stored full-size; trim to the array bounds
+                target = tuple(slice(off, min(off + c, s))
+                               for off, c, s in zip(chunk_offset, chunks, var.shape))
+                trim = tuple(slice(0, t.stop - t.start) for t in target)
+                out[target] = block[trim]
+        return np.ascontiguousarray(out.astype(out.dtype.newbyteorder('='), copy=False))
+
+    def _read_index_runs(self, var, slices):
+        """
+        Read a sorted index list as a handful of contiguous slice reads.
+
+        A list of N row indices makes netCDF4 fancy-index its way through
+        the file one element at a time. When the dialog hands us dozens of
+        mostly-adjacent indices, coalescing them into contiguous runs turns
+        N tiny reads into a few sequential ones. Returns None when the
+        selection is not a single sorted index list (order must be
+        preserved, so unsorted lists keep the normal path).
+        """
+        list_dims = [i for i, sel in enumerate(slices) if isinstance(sel, (list, np.ndarray))]
+        if len(list_dims) != 1:
+            return None
+        dim = list_dims[0]
+        if any(not isinstance(sel, slice) for i, sel in enumerate(slices) if i != dim):
+            return None
+        indices = [int(i) for i in slices[dim]]
+        if len(indices) <= 4 or any(i < 0 for i in indices) or indices != sorted(indices):
+            return None
+
+        runs = []
+        run_start = prev = indices[0]
+        for index in indices[1:]:
+            if index == prev + 1:
+                prev = index
+                continue
+            runs.append((run_start, prev + 1))
+            run_start = prev = index
+        runs.append((run_start, prev + 1))
+        if len(runs) == len(indices):
+            return None  # nothing adjacent; coalescing buys nothing
+
+        parts = []
+        for start, stop in runs:
+            run_slices = list(slices)
+            run_slices[dim] = slice(start, stop)
+            parts.append(var[tuple(run_slices)])
+        # ma.concatenate keeps the masks netCDF4's auto-masking returns
+        # (np.concatenate would silently drop them and leak raw fill
+        # values); it handles plain ndarrays the same way
+        return np.ma.concatenate(parts, axis=dim)
+
+    def _align_to_chunks(self, var, slices):
+        """
+        Expand a per-dimension selection to HDF5 chunk boundaries.
+
+        Misaligned selections make HDF5 issue many tiny partial-chunk reads;
+        reading whole chunks and trimming in NumPy is far faster for
+        chunked/compressed variables.
+
+        Args:
+            var: netCDF4 variable
+            slices (list): One slice/int per dimension
+
+        Returns:
+            tuple: (aligned_slices, trim_indices), or None if the variable is
+                   contiguous or the selection cannot be aligned (e.g. lists)
+        """
+        chunks = var.chunking()
+        if not chunks or chunks == 'contiguous':
+            return None
+
+        aligned = []
+        trims = []
+        for sel, chunk, size in zip(slices, chunks, var.shape):
+            if isinstance(sel, slice) and sel.step in (None, 1):
+                start, stop, _ = sel.indices(size)
+                aligned_start = (start // chunk) * chunk
+                aligned_stop = min(-(-stop // chunk) * chunk, size)
+                aligned.append(slice(aligned_start, aligned_stop))
+                trims.append(slice(start - aligned_start, stop - aligned_start))
+            elif isinstance(sel, int):
+                index = sel if sel >= 0 else sel + size
+                aligned_start = (index // chunk) * chunk
+                aligned.append(slice(aligned_start, min(aligned_start + chunk, size)))
+                trims.append(index - aligned_start)
+            else:
+                # Index lists (fancy indexing) keep the original read path
+                return None
+
+        return aligned, trims
+
     def read_variable(self, var_name, slice_indices=None):
         """
         Read data from a variable.
-        
+
         Args:
             var_name (str): Name of the variable to read
             slice_indices (dict): Dictionary of dimension names and slice indices
-        
+
         Returns:
             numpy.ndarray: Variable data
         """
-        if var_name not in self.dataset.variables:
+        if var_name not in self._vars:
             print(f"Variable '{var_name}' not found in the dataset.")
             return None
-        
+
         try:
+            self._tune_chunk_cache(var_name)
             if slice_indices:
                 # Apply slicing
-                var = self.dataset.variables[var_name]
+                var = self._vars[var_name]
                 slices = []
                 for dim in var.dimensions:
                     if dim in slice_indices:
                         slices.append(slice_indices[dim])
                     else:
                         slices.append(slice(None))
-                
-                data = var[slices]
+
+                # Coalesce sorted index lists into contiguous runs, and
+                # read whole chunks and trim instead of handing HDF5 a
+                # selection that straddles chunk boundaries
+                data = self._read_index_runs(var, slices)
+                if data is None:
+                    aligned = self._align_to_chunks(var, slices)
+                    if aligned is not None:
+                        aligned_slices, trims = aligned
+                        data = var[tuple(aligned_slices)][tuple(trims)]
+                    else:
+                        data = var[tuple(slices)]
             else:
-                # Read entire variable
-                data = self.dataset.variables[var_name][:]
-            
+                # Read entire variable: mmap contiguous storage when
+                # possible, read deflated chunks directly when possible,
+                # otherwise go through the normal netCDF4 path
+                var = self._vars[var_name]
+                try:
+                    data = self._mmap_contiguous(var_name, var)
+                    if data is None:
+                        data = self._read_direct_chunks(var_name, var)
+                    if data is None:
+                        data = self._read_into_buffer(var_name, var)
+                    if data is not None:
+                        data = self._mask_default_fill(var, data)
+                except Exception:
+                    data = None
+                if data is None:
+                    data = var[:]
+
             return data
         except Exception as e:
             print(f"Error reading variable '{var_name}': {e}")
@@ -201,11 +608,11 @@ class NetCDFReader:
         Returns:
             numpy.ndarray: Variable data for specified rows
         """
-        if var_name not in self.dataset.variables:
+        if var_name not in self._vars:
             print(f"Variable '{var_name}' not found in the dataset.")
             return None
         
-        var = self.dataset.variables[var_name]
+        var = self._vars[var_name]
         
         # If no dimension specified, use the first one
         if dimension_name is None:
@@ -235,43 +642,72 @@ class NetCDFReader:
             max_cols (int): Maximum number of columns to display
             max_rows (int): Maximum number of rows to display
         """
+        # For a long 1-D selection only the head and tail ever get shown, so
+        # read just those two small slices instead of materializing the whole
+        # range (a slice like 0:1000000 would otherwise be read in full)
+        var = self._vars.get(var_name)
+        if (var is not None and var.ndim == 1 and isinstance(row_indices, slice)
+                and row_indices.step in (None, 1)
+                and dimension_name in (None, var.dimensions[0])):
+            start, stop, _ = row_indices.indices(var.shape[0])
+            length = stop - start
+            if length > 2 * max_cols:
+                head = var[start:start + max_cols]
+                tail = var[stop - max_cols:stop]
+                sys.stdout.write(
+                    f"\nRow data for variable '{var_name}':\n"
+                    f"Shape: {(length,)}\n"
+                    f"Data type: {var.dtype}\n"
+                    "Data:\n"
+                    f"First {max_cols} values: {head}\n"
+                    f"Last {max_cols} values: {tail}\n"
+                    f"... (showing {max_cols} of {length} values)\n")
+                return
+
         data = self.read_specific_row(var_name, row_indices, dimension_name)
         if data is None:
             return
-        
-        print(f"\nRow data for variable '{var_name}':")
-        print(f"Shape: {data.shape}")
-        print(f"Data type: {data.dtype}")
-        
+
+        parts = [
+            f"\nRow data for variable '{var_name}':",
+            f"Shape: {data.shape}",
+            f"Data type: {data.dtype}",
+        ]
+
         # Handle different data dimensions
         if data.ndim == 1:
             # 1D data - show as a simple list
-            print("Data:")
+            parts.append("Data:")
             if len(data) <= max_cols:
-                print(data)
+                parts.append(str(data))
             else:
-                print(f"First {max_cols} values: {data[:max_cols]}")
-                print(f"Last {max_cols} values: {data[-max_cols:]}")
-                print(f"... (showing {max_cols} of {len(data)} values)")
-        
+                parts.append(f"First {max_cols} values: {data[:max_cols]}")
+                parts.append(f"Last {max_cols} values: {data[-max_cols:]}")
+                parts.append(f"... (showing {max_cols} of {len(data)} values)")
+
         elif data.ndim == 2:
-            # 2D data - show as a table
-            print("Data (rows x columns):")
+            # 2D data - show as a table, formatted in one vectorized
+            # array2string call instead of a Python loop per row
+            parts.append("Data (rows x columns):")
             rows_to_show = min(data.shape[0], max_rows)
             cols_to_show = min(data.shape[1], max_cols)
-            
-            for i in range(rows_to_show):
-                row_data = data[i, :cols_to_show]
-                print(f"Row {i}: {row_data}")
-                if data.shape[1] > max_cols:
-                    print(f"      ... (showing {cols_to_show} of {data.shape[1]} columns)")
-        
+
+            block = data[:rows_to_show, :cols_to_show]
+            parts.append(np.array2string(block, max_line_width=200, precision=6,
+                                         suppress_small=True, separator=', '))
+            if data.shape[1] > max_cols:
+                parts.append(f"... (showing {cols_to_show} of {data.shape[1]} columns)")
+            if data.shape[0] > max_rows:
+                parts.append(f"... (showing {rows_to_show} of {data.shape[0]} rows)")
+
         else:
             # Higher dimensional data
-            print("Data (higher dimensional):")
-            print(f"Showing first few elements: {data.flatten()[:max_cols]}")
+            parts.append("Data (higher dimensional):")
+            parts.append(f"Showing first few elements: {np.ravel(data)[:max_cols]}")
             if data.size > max_cols:
-                print(f"... (showing {max_cols} of {data.size} total elements)")
+                parts.append(f"... (showing {max_cols} of {data.size} total elements)")
+
+        sys.stdout.write('\n'.join(parts) + '\n')
     
     def get_data_summary(self, var_name, slice_indices=None):
         """
@@ -288,20 +724,25 @@ class NetCDFReader:
         if data is None:
             return None
         
-        # Handle masked arrays
-        if hasattr(data, 'mask'):
+        # Handle masked arrays; .compressed() always copies, so only pay for
+        # it when elements are actually masked — nomask (all-valid) is the
+        # common case for real files
+        if isinstance(data, np.ma.MaskedArray) and data.mask is not np.ma.nomask and data.mask.any():
             data_clean = data.compressed()
         else:
-            data_clean = data.flatten()
+            # ravel returns a view when the data is contiguous;
+            # flatten always copies the whole array
+            data_clean = np.ravel(np.ma.getdata(data))
         
+        mn, mx, mean, std = _finish_stats(*_partial_stats(data_clean))
         summary = {
             'shape': data.shape,
             'size': data.size,
             'dtype': str(data.dtype),
-            'min': float(np.min(data_clean)),
-            'max': float(np.max(data_clean)),
-            'mean': float(np.mean(data_clean)),
-            'std': float(np.std(data_clean)),
+            'min': mn,
+            'max': mx,
+            'mean': mean,
+            'std': std,
             'first_10_values': data_clean[:10].tolist(),
             'last_10_values': data_clean[-10:].tolist() if len(data_clean) > 10 else data_clean.tolist()
         }
@@ -310,23 +751,74 @@ class NetCDFReader:
     
     def get_variable_statistics(self, var_name):
         """Get basic statistics for a variable."""
+        if var_name not in self._vars:
+            print(f"Variable '{var_name}' not found in the dataset.")
+            return None
+
+        # Chunked variables are reduced band-by-band along the first
+        # dimension: the running (count, min, max, sum, sumsq) partials are
+        # merged per band, so memory stays bounded to one band of chunks
+        # instead of materializing a potentially huge array for 4 scalars.
+        var = self._vars[var_name]
+        chunking = None
+        try:
+            chunking = var.chunking()
+        except Exception:
+            pass
+        if chunking and chunking != 'contiguous' and var.ndim >= 1 and var.shape[0] > chunking[0]:
+            self._tune_chunk_cache(var_name)
+            totals = None
+            band = chunking[0]  # band starts stay chunk-aligned
+            for start in range(0, var.shape[0], band):
+                block = var[start:start + band, ...]
+                if isinstance(block, np.ma.MaskedArray) and block.mask is not np.ma.nomask and block.mask.any():
+                    block = block.compressed()
+                else:
+                    block = np.ma.getdata(block)
+                n, mn, mx, s, s2 = _partial_stats(block)
+                if n == 0:
+                    continue
+                if totals is None:
+                    totals = [n, mn, mx, s, s2]
+                else:
+                    totals[0] += n
+                    totals[1] = min(totals[1], mn)
+                    totals[2] = max(totals[2], mx)
+                    totals[3] += s
+                    totals[4] += s2
+            if totals is not None:
+                mn, mx, mean, std = _finish_stats(*totals)
+                return {
+                    'min': mn,
+                    'max': mx,
+                    'mean': mean,
+                    'std': std,
+                    'shape': var.shape,
+                    'size': totals[0]
+                }
+            return None
+
         data = self.read_variable(var_name)
         if data is None:
             return None
         
-        # Handle masked arrays
-        if hasattr(data, 'mask'):
+        # Handle masked arrays; skip the compressed() copy when nothing is
+        # actually masked
+        if isinstance(data, np.ma.MaskedArray) and data.mask is not np.ma.nomask and data.mask.any():
             data = data.compressed()
-        
+        else:
+            data = np.ma.getdata(data)
+
+        mn, mx, mean, std = _finish_stats(*_partial_stats(data))
         stats = {
-            'min': float(np.min(data)),
-            'max': float(np.max(data)),
-            'mean': float(np.mean(data)),
-            'std': float(np.std(data)),
+            'min': mn,
+            'max': mx,
+            'mean': mean,
+            'std': std,
             'shape': data.shape,
             'size': data.size
         }
-        
+
         return stats
     
     def print_variable_statistics(self, var_name):
@@ -335,20 +827,21 @@ class NetCDFReader:
         if not stats:
             return
         
-        print(f"\nStatistics for variable '{var_name}':")
-        print(f"Shape: {stats['shape']}")
-        print(f"Size: {stats['size']:,}")
-        print(f"Min: {stats['min']:.6f}")
-        print(f"Max: {stats['max']:.6f}")
-        print(f"Mean: {stats['mean']:.6f}")
-        print(f"Std: {stats['std']:.6f}")
+        sys.stdout.write(
+            f"\nStatistics for variable '{var_name}':\n"
+            f"Shape: {stats['shape']}\n"
+            f"Size: {stats['size']:,}\n"
+            f"Min: {stats['min']:.6f}\n"
+            f"Max: {stats['max']:.6f}\n"
+            f"Mean: {stats['mean']:.6f}\n"
+            f"Std: {stats['std']:.6f}\n")
     
     def list_variables(self):
         """List all variables in the dataset."""
-        print("\nAvailable variables:")
-        for i, var_name in enumerate(self.dataset.variables.keys(), 1):
-            var = self.dataset.variables[var_name]
-            print(f"{i:2d}. {var_name} ({', '.join(var.dimensions)})")
+        parts = ["\nAvailable variables:"]
+        parts.extend(f"{i:2d}. {var_name} ({', '.join(var.dimensions)})"
+                     for i, (var_name, var) in enumerate(self._vars.items(), 1))
+        sys.stdout.write('\n'.join(parts) + '\n')
     
     def plot_variable(self, var_name, slice_indices=None, save_path=None):
         """
@@ -362,40 +855,67 @@ class NetCDFReader:
         data = self.read_variable(var_name, slice_indices)
         if data is None:
             return
-        
+
         # Handle masked arrays
         if hasattr(data, 'mask'):
             data = data.filled(np.nan)
-        
-        # Create plot based on data dimensions
-        plt.figure(figsize=(10, 6))
-        
+
+        # Displays are 8-bit, so float64 precision is wasted on the render
+        # pipeline: float32 halves the bytes pushed through the colormap
+        if data.dtype == np.float64:
+            data = data.astype(np.float32, copy=False)
+        # A screen holds ~2 Mpx; decimate huge images before imshow instead
+        # of feeding it pixels nobody can see
+        if data.ndim == 2 and data.size > 4_000_000:
+            step_y = max(1, data.shape[0] // 2000)
+            step_x = max(1, data.shape[1] // 2000)
+            data = data[::step_y, ::step_x]
+
+        if save_path:
+            # Scripted use: draw with the OO API onto one reused Figure and
+            # render through Agg directly — no pyplot state machine, no
+            # figure leak when plotting in a loop
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            fig = self._get_figure()
+            self._draw_plot(fig, data, var_name)
+            FigureCanvasAgg(fig).print_figure(save_path, dpi=300, bbox_inches='tight')
+            print(f"Plot saved to: {save_path}")
+        else:
+            # Interactive display needs a GUI backend, which only pyplot
+            # manages; this path is human-paced anyway
+            import matplotlib.pyplot as plt
+            fig = plt.figure(figsize=(10, 6))
+            self._draw_plot(fig, data, var_name)
+            plt.show()
+
+    def _get_figure(self):
+        """Return the reusable Figure, cleared and ready to draw on."""
+        from matplotlib.figure import Figure
+        if self._fig is None:
+            self._fig = Figure(figsize=(10, 6))
+        else:
+            self._fig.clear()
+        return self._fig
+
+    def _draw_plot(self, fig, data, var_name):
+        """Draw data onto fig: line plot for 1-D, image for 2-D and above."""
+        ax = fig.add_subplot(111)
+
         if data.ndim == 1:
-            plt.plot(data)
-            plt.title(f'{var_name}')
-            plt.xlabel('Index')
-            plt.ylabel('Value')
-        elif data.ndim == 2:
-            plt.imshow(data, cmap='viridis', aspect='auto')
-            plt.colorbar(label=var_name)
-            plt.title(f'{var_name}')
+            ax.plot(data)
+            ax.set_title(f'{var_name}')
+            ax.set_xlabel('Index')
+            ax.set_ylabel('Value')
         else:
-            # For higher dimensions, take a slice
+            title = f'{var_name}'
             if data.ndim > 2:
                 # Take the middle slice for each extra dimension
                 slices = [data.shape[i]//2 for i in range(2, data.ndim)]
                 data = data[:, :, *slices]
-                plt.imshow(data, cmap='viridis', aspect='auto')
-                plt.colorbar(label=var_name)
-                plt.title(f'{var_name} (slice)')
-        
-        plt.tight_layout()
-        
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            print(f"Plot saved to: {save_path}")
-        else:
-            plt.show()
+                title = f'{var_name} (slice)'
+            image = ax.imshow(data, cmap='viridis', aspect='auto')
+            fig.colorbar(image, ax=ax, label=var_name)
+            ax.set_title(title)
     
     def export_to_csv(self, var_name, output_path, slice_indices=None):
         """
@@ -413,20 +933,40 @@ class NetCDFReader:
         # Handle masked arrays
         if hasattr(data, 'mask'):
             data = data.filled(np.nan)
-        
-        # Convert to DataFrame
-        if data.ndim == 1:
-            df = pd.DataFrame({var_name: data})
-        elif data.ndim == 2:
-            df = pd.DataFrame(data)
-            df.columns = [f'{var_name}_col_{i}' for i in range(data.shape[1])]
-            df.index.name = f'{var_name}_row'
-        else:
+
+        # Only 1-D and 2-D data map onto CSV; 0-d scalars (e.g. grid-mapping
+        # variables) and higher-dimensional arrays are rejected up front
+        if data.ndim not in (1, 2):
             print(f"Cannot export {data.ndim}-dimensional data to CSV directly.")
             return
-        
-        # Save to CSV
-        df.to_csv(output_path, index=True)
+
+        # Stream rows straight from the array with np.savetxt; building a
+        # DataFrame first doubles memory and its CSV writer is slower on
+        # numeric data. Non-numeric variables fall back to pandas.
+        if data.dtype.kind in 'fiu':
+            if data.ndim == 1:
+                header = var_name
+            else:
+                header = ','.join(f'{var_name}_col_{i}' for i in range(data.shape[1]))
+            # Pick the format from the dtype so the file keeps the precision
+            # stored on disk: integers exact (epoch-second time variables
+            # overflow %g), floats at full round-trip precision
+            if data.dtype.kind in 'iu':
+                fmt = '%d'
+            elif data.dtype.itemsize <= 4:
+                fmt = '%.9g'
+            else:
+                fmt = '%.17g'
+            np.savetxt(output_path, data, delimiter=',', header=header,
+                       comments='', fmt=fmt)
+        else:
+            import pandas as pd
+            if data.ndim == 1:
+                df = pd.DataFrame({var_name: data})
+            else:
+                df = pd.DataFrame(data)
+                df.columns = [f'{var_name}_col_{i}' for i in range(data.shape[1])]
+            df.to_csv(output_path, index=False)
         print(f"Data exported to: {output_path}")
     
     def close(self):
@@ -437,9 +977,11 @@ class NetCDFReader:
 
 def get_file_path_via_dialog():
     """Open a file dialog to select a NetCDF file."""
-    if tk is None or filedialog is None:
+    modules = _import_tk()
+    if modules is None:
         print("tkinter is not available. Please provide the file path as a command-line argument.")
         sys.exit(1)
+    tk, filedialog, _, _ = modules
     root = tk.Tk()
     root.withdraw()
     file_path = filedialog.askopenfilename(
@@ -454,9 +996,11 @@ def get_file_path_via_dialog():
 
 def get_n_rows_via_dialog():
     """Prompt the user for the number of rows to display."""
-    if tk is None or simpledialog is None:
+    modules = _import_tk()
+    if modules is None:
         print("tkinter is not available. Please provide the number of rows as a command-line argument.")
         sys.exit(1)
+    tk, _, simpledialog, _ = modules
     root = tk.Tk()
     root.withdraw()
     n = simpledialog.askinteger("Number of Rows", "How many rows do you want to display?", minvalue=1, initialvalue=5)
@@ -468,9 +1012,11 @@ def get_n_rows_via_dialog():
 
 def get_variable_name_via_dialog(var_names):
     """Prompt the user to select a variable name from a list using a dropdown."""
-    if tk is None:
+    modules = _import_tk()
+    if modules is None:
         print("tkinter is not available. Please provide the variable name as a command-line argument.")
         sys.exit(1)
+    tk = modules[0]
     root = tk.Tk()
     root.withdraw()
     # Use a simple dropdown dialog
@@ -497,9 +1043,11 @@ def get_variable_name_via_dialog(var_names):
 
 def get_save_path_via_dialog(default_name="output.csv"):
     """Prompt the user for a save file path using a file dialog."""
-    if tk is None or filedialog is None:
+    modules = _import_tk()
+    if modules is None:
         print("tkinter is not available. Please provide the output file path as a command-line argument.")
         sys.exit(1)
+    tk, filedialog, _, _ = modules
     root = tk.Tk()
     root.withdraw()
     file_path = filedialog.asksaveasfilename(
@@ -516,9 +1064,11 @@ def get_save_path_via_dialog(default_name="output.csv"):
 
 def get_row_indices_via_dialog(coord_values):
     """Prompt the user to select specific row indices or values from the first dimension. Blank means all rows."""
-    if tk is None or simpledialog is None:
+    modules = _import_tk()
+    if modules is None:
         print("tkinter is not available. Please provide the row indices as a command-line argument.")
         sys.exit(1)
+    tk, _, simpledialog, _ = modules
     root = tk.Tk()
     root.withdraw()
     preview = ', '.join(str(v) for v in coord_values[:20])
@@ -527,18 +1077,20 @@ def get_row_indices_via_dialog(coord_values):
     root.destroy()
     if not indices_str or indices_str.strip() == '':
         return None  # None means all rows
-    indices = []
-    if ':' in indices_str:
-        parts = indices_str.split(':')
-        if len(parts) == 2:
-            start = int(parts[0])
-            end = int(parts[1])
-            indices = list(range(start, end))
-        else:
-            print("Invalid range format. Use start:end.")
-            sys.exit(1)
-    else:
-        indices = [int(i.strip()) for i in indices_str.split(',') if i.strip().isdigit()]
+    # Ranges become slice objects: netCDF4 turns a slice into one
+    # contiguous read, whereas a materialized index list triggers
+    # per-element fancy indexing (and wastes memory for large ranges)
+    range_match = re.fullmatch(r'\s*(-?\d+)\s*:\s*(-?\d+)(?:\s*:\s*(-?\d+))?\s*', indices_str)
+    if range_match:
+        step = int(range_match[3]) if range_match[3] else None
+        return slice(int(range_match[1]), int(range_match[2]), step)
+    try:
+        # One pass; a bad token is an error instead of being silently
+        # dropped (the old .isdigit() filter also ate negative indices)
+        indices = [int(token) for token in indices_str.split(',')]
+    except ValueError:
+        print("Invalid indices. Use comma-separated integers (e.g. 0,1,2) or a range (e.g. 0:10).")
+        sys.exit(1)
     if not indices:
         print("No valid indices parsed. Exiting.")
         sys.exit(1)
@@ -574,7 +1126,9 @@ def main():
             max_rows = var_obj.shape[0]
             var_info = f"Variable: {var_name}\nShape: {var_obj.shape}\nDimensions: {var_obj.dimensions}\nDtype: {var_obj.dtype}"
             print(var_info)
-            if messagebox is not None:
+            modules = _import_tk()
+            if modules is not None:
+                tk, _, _, messagebox = modules
                 root = tk.Tk()
                 root.withdraw()
                 messagebox.showinfo("Variable Info", var_info)
@@ -584,7 +1138,13 @@ def main():
             else:
                 coord_values = list(range(max_rows))
             row_indices = get_row_indices_via_dialog(coord_values)
-            output_path = get_save_path_via_dialog(f"{var_name}_all_rows.csv" if row_indices is None else f"{var_name}_rows_{'_'.join(map(str, row_indices[:3]))}.csv")
+            if row_indices is None:
+                default_name = f"{var_name}_all_rows.csv"
+            elif isinstance(row_indices, slice):
+                default_name = f"{var_name}_rows_{row_indices.start}_{row_indices.stop}.csv"
+            else:
+                default_name = f"{var_name}_rows_{'_'.join(map(str, row_indices[:3]))}.csv"
+            output_path = get_save_path_via_dialog(default_name)
             if row_indices is None:
                 print(f"\nExporting ALL rows of variable '{var_name}' to {output_path}")
                 reader.export_to_csv(var_name, output_path)
@@ -607,28 +1167,42 @@ def main():
         # Print file information
         if args.info:
             reader.print_file_info()
-        
+
         # List variables
         if args.list_vars:
             reader.list_variables()
-        
+
+        # Collect the requested actions and run them one after another.
+        # They are deliberately NOT threaded: netCDF4-python releases the
+        # GIL around libnetcdf calls, and neither libnetcdf nor a default
+        # (non-threadsafe) libhdf5 build tolerates concurrent calls — even
+        # through separate Dataset handles — so overlapping reads can
+        # segfault. Each action still emits its output with a single
+        # atomic write.
+        batch_actions = []
+        def add_action(func):
+            batch_actions.append(func)
+
         # Variable information
         if args.var_info:
-            reader.print_variable_info(args.var_info)
-        
+            add_action(lambda name=args.var_info: reader.print_variable_info(name))
+
         # Variable statistics
         if args.var_stats:
-            reader.print_variable_statistics(args.var_stats)
-        
+            add_action(lambda name=args.var_stats: reader.print_variable_statistics(name))
+
         # Read variable
         if args.read_var:
-            data = reader.read_variable(args.read_var)
-            if data is not None:
-                print(f"\nData for variable '{args.read_var}':")
-                print(f"Shape: {data.shape}")
-                print(f"Type: {data.dtype}")
-                print(f"First few values: {data.flatten()[:10]}")
-        
+            def preview_variable(name=args.read_var):
+                data = reader.read_variable(name)
+                if data is not None:
+                    sys.stdout.write(
+                        f"\nData for variable '{name}':\n"
+                        f"Shape: {data.shape}\n"
+                        f"Type: {data.dtype}\n"
+                        f"First few values: {np.ravel(data)[:10]}\n")
+            add_action(preview_variable)
+
         # Read specific rows
         if args.read_row:
             try:
@@ -636,40 +1210,47 @@ def main():
                 if ':' in args.read_row:
                     parts = args.read_row.split(':')
                     var_name = parts[0]
-                    
+
                     if len(parts) == 2:
                         # Single row index
                         row_index = int(parts[1])
-                        reader.print_row_data(var_name, row_index, args.dimension)
+                        add_action(lambda v=var_name, idx=row_index: reader.print_row_data(v, idx, args.dimension))
                     elif len(parts) == 3:
                         # Range of rows
                         start_row = int(parts[1])
                         end_row = int(parts[2])
                         row_indices = slice(start_row, end_row)
-                        reader.print_row_data(var_name, row_indices, args.dimension)
+                        add_action(lambda v=var_name, idx=row_indices: reader.print_row_data(v, idx, args.dimension))
                     else:
                         print("Invalid row specification. Use format: variable_name:row_index or variable_name:start:end")
                 else:
                     print("Invalid row specification. Use format: variable_name:row_index or variable_name:start:end")
             except ValueError as e:
                 print(f"Error parsing row specification: {e}")
-        
-        # Plot variable
-        if args.plot_var:
-            output_path = args.output if args.output else None
-            reader.plot_variable(args.plot_var, save_path=output_path)
-        
+
+        # Plot variable (showing a window waits for the user, so only saved
+        # plots join the batch)
+        if args.plot_var and args.output:
+            add_action(lambda name=args.plot_var: reader.plot_variable(name, save_path=args.output))
+
         # Export variable
         if args.export_var:
             output_path = args.output if args.output else f"{args.export_var}.csv"
-            reader.export_to_csv(args.export_var, output_path)
-        
+            add_action(lambda name=args.export_var, out=output_path: reader.export_to_csv(name, out))
+
+        for action in batch_actions:
+            action()
+
+        # Interactive plot display, after the batch work
+        if args.plot_var and not args.output:
+            reader.plot_variable(args.plot_var)
+
         # If no specific action is specified, print file info
-        if not any([args.info, args.list_vars, args.var_info, args.var_stats, 
+        if not any([args.info, args.list_vars, args.var_info, args.var_stats,
                    args.read_var, args.plot_var, args.export_var]):
             reader.print_file_info()
             reader.list_variables()
-    
+
     finally:
         reader.close()
 